@@ -240,11 +240,19 @@ def run_normal_checks(
     )
 
     watchman_info = check_watchman.pre_check()
+    bind_mount_stat_threads = check_bind_mounts.get_stat_threads(instance)
 
     for path, checkout in sorted(checkouts.items()):
         out.writeln(f"Checking {path}")
         try:
-            check_mount(tracker, checkout, mount_table, fs_util, watchman_info)
+            check_mount(
+                tracker,
+                checkout,
+                mount_table,
+                fs_util,
+                watchman_info,
+                bind_mount_stat_threads,
+            )
         except Exception as ex:
             tracker.add_problem(
                 Problem(f"unexpected error while checking {path}: {ex}")
@@ -257,12 +265,20 @@ def check_mount(
     mount_table: mtab.MountTable,
     fs_util: filesystem.FsUtil,
     watchman_info: check_watchman.WatchmanCheckInfo,
+    bind_mount_stat_threads: int = check_bind_mounts.DEFAULT_STAT_THREADS,
 ) -> None:
     if checkout.state is None:
         # This checkout is configured but not currently running.
         tracker.add_problem(CheckoutNotMounted(checkout))
     elif checkout.state == MountState.RUNNING:
-        check_running_mount(tracker, checkout, mount_table, fs_util, watchman_info)
+        check_running_mount(
+            tracker,
+            checkout,
+            mount_table,
+            fs_util,
+            watchman_info,
+            bind_mount_stat_threads,
+        )
     elif checkout.state in (
         MountState.UNINITIALIZED,
         MountState.INITIALIZING,
@@ -311,6 +327,7 @@ def check_running_mount(
     mount_table: mtab.MountTable,
     fs_util: filesystem.FsUtil,
     watchman_info: check_watchman.WatchmanCheckInfo,
+    bind_mount_stat_threads: int = check_bind_mounts.DEFAULT_STAT_THREADS,
 ) -> None:
     if checkout_info.configured_state_dir is None:
         tracker.add_problem(CheckoutNotConfigured(checkout_info))
@@ -332,7 +349,9 @@ def check_running_mount(
 
     check_filesystems.check_using_nfs_path(tracker, checkout.path)
     check_watchman.check_active_mount(tracker, str(checkout.path), watchman_info)
-    check_bind_mounts.check_bind_mounts(tracker, checkout, mount_table, fs_util)
+    check_bind_mounts.check_bind_mounts(
+        tracker, checkout, mount_table, fs_util, stat_threads=bind_mount_stat_threads
+    )
     if config.scm_type == "hg":
         check_hg.check_hg(tracker, checkout)
 
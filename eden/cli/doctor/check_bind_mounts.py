@@ -9,19 +9,54 @@
 
 import collections
 import errno
+import logging
 import os
 import stat
+from typing import Dict, Optional
 
-from eden.cli import filesystem, mtab
-from eden.cli.config import EdenCheckout
+from eden.cli import configutil, filesystem, mtab
+from eden.cli.config import EdenCheckout, EdenInstance
 from eden.cli.doctor.problem import FixableProblem, Problem, ProblemTracker
 
 
+log = logging.getLogger("eden.cli.doctor.checks.bind_mounts")
+
+# The maximum number of bind mount paths to lstat() concurrently.  Local lstat()
+# calls are far cheaper than starting a thread pool, so this is only worth raising
+# (with the doctor.bind-mount-stat-threads config option) when bind mounts live on
+# a network filesystem.
+DEFAULT_STAT_THREADS = 1
+
+
+def get_stat_threads(instance: EdenInstance) -> int:
+    """Return the number of threads check_bind_mounts() should use to lstat() bind
+    mount paths, as configured by doctor.bind-mount-stat-threads."""
+    try:
+        value = instance.get_config_value(
+            "doctor.bind-mount-stat-threads", default=str(DEFAULT_STAT_THREADS)
+        )
+        num_threads = int(value)
+    except configutil.UnexpectedType as ex:
+        # For example, the option was written as a TOML integer instead of a string.
+        value = ex.value
+        num_threads = 0
+    except ValueError:
+        num_threads = 0
+    if num_threads < 1:
+        log.warning(
+            f"ignoring invalid doctor.bind-mount-stat-threads value {value!r}; "
+            f"using {DEFAULT_STAT_THREADS}"
+        )
+        return DEFAULT_STAT_THREADS
+    return num_threads
+
+
 def check_bind_mounts(
     tracker: ProblemTracker,
     checkout: EdenCheckout,
     mount_table: mtab.MountTable,
     fs_util: filesystem.FsUtil,
+    stat_threads: int = DEFAULT_STAT_THREADS,
 ) -> None:
     """Check that bind mounts exist and have different device IDs than the top-level
     checkout mount path, to confirm that they are mounted."""
@@ -44,64 +79,82 @@ def check_bind_mounts(
         path_in_mount_dir = os.path.join(mount_path, mount_suffix)
         client_mount_path_dict[path_in_client_dir] = path_in_mount_dir
 
+    # When using several threads, stat all of the paths up front.  Note that the
+    # problems found below are fixed as soon as they are reported, so in this mode
+    # a bind mount nested inside another one is judged by its state from before the
+    # outer bind mount was remounted.  With a single thread each path is stat'ed
+    # right before it is checked, after the fixes for the preceding paths.
+    stat_results: Optional[Dict[str, mtab.LStatResult]] = None
+    if stat_threads > 1:
+        paths = [*client_mount_path_dict.keys(), *client_mount_path_dict.values()]
+        stat_results = dict(
+            zip(paths, mount_table.lstat_batch(paths, num_threads=stat_threads))
+        )
+
     for path_in_client_dir, path_in_mount_dir in client_mount_path_dict.items():
-        _check_bind_mount_client_path(tracker, path_in_client_dir, mount_table, fs_util)
+        _check_bind_mount_client_path(
+            tracker,
+            path_in_client_dir,
+            _lstat(mount_table, path_in_client_dir, stat_results),
+            fs_util,
+        )
         _check_bind_mount_path(
             tracker,
             path_in_client_dir,
             path_in_mount_dir,
+            _lstat(mount_table, path_in_mount_dir, stat_results),
             checkout_path_stat,
             mount_table,
             fs_util,
         )
 
 
+def _lstat(
+    mount_table: mtab.MountTable,
+    path: str,
+    stat_results: Optional[Dict[str, mtab.LStatResult]],
+) -> mtab.LStatResult:
+    if stat_results is not None:
+        return stat_results[path]
+    try:
+        return mount_table.lstat(path)
+    except OSError as ex:
+        return ex
+
+
 def _check_bind_mount_client_path(
     tracker: ProblemTracker,
     path: str,
-    mount_table: mtab.MountTable,
+    client_stat: mtab.LStatResult,
     fs_util: filesystem.FsUtil,
 ) -> None:
     # Identify missing or non-directory client paths
-    try:
-        client_stat = mount_table.lstat(path)
-        if not stat.S_ISDIR(client_stat.st_mode):
-            tracker.add_problem(NonDirectoryFile(path))
-    except OSError as ex:
-        if ex.errno == errno.ENOENT:
+    if isinstance(client_stat, OSError):
+        if client_stat.errno == errno.ENOENT:
             tracker.add_problem(MissingBindMountClientDir(path, fs_util))
         else:
             tracker.add_problem(
-                Problem(f"Failed to lstat bind mount source directory: {path}: {ex}")
+                Problem(
+                    f"Failed to lstat bind mount source directory: {path}: "
+                    f"{client_stat}"
+                )
             )
+    elif not stat.S_ISDIR(client_stat.st_mode):
+        tracker.add_problem(NonDirectoryFile(path))
 
 
 def _check_bind_mount_path(
     tracker: ProblemTracker,
     mount_source: str,
     mount_point: str,
+    bind_mount_stat: mtab.LStatResult,
     checkout_path_stat: mtab.MTStat,
     mount_table: mtab.MountTable,
     fs_util: filesystem.FsUtil,
 ) -> None:
     # Identify missing or not mounted bind mounts
-    try:
-        bind_mount_stat = mount_table.lstat(mount_point)
-        if not stat.S_ISDIR(bind_mount_stat.st_mode):
-            tracker.add_problem(NonDirectoryFile(mount_point))
-            return
-        if bind_mount_stat.st_dev == checkout_path_stat.st_dev:
-            tracker.add_problem(
-                BindMountNotMounted(
-                    mount_source,
-                    mount_point,
-                    mkdir=False,
-                    fs_util=fs_util,
-                    mount_table=mount_table,
-                )
-            )
-    except OSError as ex:
-        if ex.errno == errno.ENOENT:
+    if isinstance(bind_mount_stat, OSError):
+        if bind_mount_stat.errno == errno.ENOENT:
             tracker.add_problem(
                 BindMountNotMounted(
                     mount_source,
@@ -113,6 +166,21 @@ def _check_bind_mount_path(
             )
         else:
             tracker.add_problem(Problem(f"Failed to lstat mount path: {mount_point}"))
+        return
+
+    if not stat.S_ISDIR(bind_mount_stat.st_mode):
+        tracker.add_problem(NonDirectoryFile(mount_point))
+        return
+    if bind_mount_stat.st_dev == checkout_path_stat.st_dev:
+        tracker.add_problem(
+            BindMountNotMounted(
+                mount_source,
+                mount_point,
+                mkdir=False,
+                fs_util=fs_util,
+                mount_table=mount_table,
+            )
+        )
 
 
 class NonDirectoryFile(Problem):
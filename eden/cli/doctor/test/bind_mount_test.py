@@ -8,8 +8,10 @@
 # of patent rights can be found in the PATENTS file in the same directory.
 
 import os
+import stat
 import typing
 from pathlib import Path
+from string import Template
 from typing import Dict, Optional, Tuple
 
 import eden.cli.doctor as doctor
@@ -17,10 +19,23 @@ from eden.cli import filesystem, mtab
 from eden.cli.config import EdenCheckout, EdenInstance
 from eden.cli.doctor import check_bind_mounts
 from eden.cli.doctor.test.lib.fake_eden_instance import FakeEdenInstance
-from eden.cli.doctor.test.lib.fake_mount_table import FakeMountTable
+from eden.cli.doctor.test.lib.fake_mount_table import (
+    DEFAULT_DIR_MODE,
+    DEFAULT_UID,
+    FakeMountTable,
+)
 from eden.cli.doctor.test.lib.testcase import DoctorTestBase
 
 
+# Stat results shared by all of the tests below.  MTStat is immutable, so the same
+# objects can safely be stored in every test's FakeMountTable.
+STAT_DIR_DEV11 = mtab.MTStat(st_uid=DEFAULT_UID, st_dev=11, st_mode=DEFAULT_DIR_MODE)
+STAT_DIR_DEV12 = mtab.MTStat(st_uid=DEFAULT_UID, st_dev=12, st_mode=DEFAULT_DIR_MODE)
+STAT_FILE_DEV11 = mtab.MTStat(
+    st_uid=DEFAULT_UID, st_dev=11, st_mode=stat.S_IFREG | 0o644
+)
+
+
 class FakeFsUtil(filesystem.FsUtil):
     def __init__(self) -> None:
         self.path_error: Dict[str, str] = {}
@@ -64,11 +79,18 @@ class BindMountsCheckTest(DoctorTestBase):
         self.bm2 = os.path.join(self.edenfs_path1, "fbandroid/buck-out")
         self.bm3 = os.path.join(self.edenfs_path1, "buck-out")
 
+    def expected_output(self, template: Template) -> str:
+        return template.substitute(
+            edenfs_path1=self.edenfs_path1,
+            fbsource_bind_mounts=self.fbsource_bind_mounts,
+        )
+
     def run_check(
         self,
         mount_table: mtab.MountTable,
         dry_run: bool,
         fs_util: Optional[FakeFsUtil] = None,
+        stat_threads: int = check_bind_mounts.DEFAULT_STAT_THREADS,
     ) -> Tuple[doctor.ProblemFixer, str]:
         fixer, out = self.create_fixer(dry_run)
         if fs_util is None:
@@ -79,633 +101,499 @@ class BindMountsCheckTest(DoctorTestBase):
             Path(self.fbsource_client),
         )
         check_bind_mounts.check_bind_mounts(
-            fixer, checkout, mount_table=mount_table, fs_util=fs_util
+            fixer,
+            checkout,
+            mount_table=mount_table,
+            fs_util=fs_util,
+            stat_threads=stat_threads,
         )
         return fixer, out.getvalue()
 
     def test_bind_mounts_okay(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm3] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
 
         fixer, out = self.run_check(mount_table, dry_run=False)
         self.assertEqual("", out)
         self.assert_results(fixer, num_problems=0)
 
+    EXPECTED_BIND_MOUNTS_MISSING_DRY_RUN = Template(
+        """\
+<yellow>- Found problem:<reset>
+Bind mount at ${edenfs_path1}/fbcode/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/fbcode/buck-out
+
+<yellow>- Found problem:<reset>
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/fbandroid/buck-out
+
+<yellow>- Found problem:<reset>
+Bind mount at ${edenfs_path1}/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/buck-out
+
+"""
+    )
+
     def test_bind_mounts_missing_dry_run(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm3] = STAT_DIR_DEV12
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV12
+        mount_table.stats[self.bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.bm3] = STAT_DIR_DEV12
 
         fixer, out = self.run_check(mount_table, dry_run=True)
         self.assertEqual(
-            f"""\
+            self.expected_output(self.EXPECTED_BIND_MOUNTS_MISSING_DRY_RUN), out
+        )
+        self.assert_results(fixer, num_problems=3)
+
+    EXPECTED_BIND_MOUNTS_MISSING = Template(
+        """\
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbcode/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/fbcode/buck-out
+Bind mount at ${edenfs_path1}/fbcode/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/fbcode/buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/fbandroid/buck-out
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/fbandroid/buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/buck-out
+Bind mount at ${edenfs_path1}/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/buck-out...<green>fixed<reset>
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=3)
+"""
+    )
 
     def test_bind_mounts_missing(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm3] = STAT_DIR_DEV12
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV12
+        mount_table.stats[self.bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.bm3] = STAT_DIR_DEV12
 
         mount_table.bind_mount_success_paths[self.client_bm1] = self.bm1
         mount_table.bind_mount_success_paths[self.client_bm2] = self.bm2
         mount_table.bind_mount_success_paths[self.client_bm3] = self.bm3
 
         fixer, out = self.run_check(mount_table, dry_run=False)
-        self.assertEqual(
-            f"""\
+        self.assertEqual(self.expected_output(self.EXPECTED_BIND_MOUNTS_MISSING), out)
+        self.assert_results(fixer, num_problems=3, num_fixed_problems=3)
+
+    EXPECTED_BIND_MOUNTS_MISSING_FAIL = Template(
+        """\
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbcode/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/fbcode/buck-out...<green>fixed<reset>
+Bind mount at ${edenfs_path1}/fbcode/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/fbcode/buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/fbandroid/buck-out...<green>fixed<reset>
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/fbandroid/buck-out...<red>error<reset>
+Failed to fix problem: Command 'sudo mount -o bind \
+${fbsource_bind_mounts}/fbandroid-buck-out \
+${edenfs_path1}/fbandroid/buck-out' returned non-zero exit status 1.
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/buck-out...<green>fixed<reset>
+Bind mount at ${edenfs_path1}/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/buck-out...<red>error<reset>
+Failed to fix problem: Command \
+'sudo mount -o bind ${fbsource_bind_mounts}/buck-out \
+${edenfs_path1}/buck-out' returned non-zero exit status 1.
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=3, num_fixed_problems=3)
+"""
+    )
 
     def test_bind_mounts_missing_fail(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm3] = STAT_DIR_DEV12
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV12
+        mount_table.stats[self.bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.bm3] = STAT_DIR_DEV12
 
         # These bound mind operations will succeed.
         mount_table.bind_mount_success_paths[self.client_bm1] = self.bm1
 
         fixer, out = self.run_check(mount_table, dry_run=False)
         self.assertEqual(
-            f"""\
-<yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbcode/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/fbcode/buck-out...<green>fixed<reset>
-
-<yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/fbandroid/buck-out...<red>error<reset>
-Failed to fix problem: Command 'sudo mount -o bind \
-{self.fbsource_bind_mounts}/fbandroid-buck-out \
-{self.edenfs_path1}/fbandroid/buck-out' returned non-zero exit status 1.
-
-<yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/buck-out...<red>error<reset>
-Failed to fix problem: Command \
-'sudo mount -o bind {self.fbsource_bind_mounts}/buck-out \
-{self.edenfs_path1}/buck-out' returned non-zero exit status 1.
-
-""",
-            out,
+            self.expected_output(self.EXPECTED_BIND_MOUNTS_MISSING_FAIL), out
         )
         self.assert_results(
             fixer, num_problems=3, num_fixed_problems=1, num_failed_fixes=2
         )
 
-    def test_bind_mounts_and_dir_missing_dry_run(self):
-        mount_table = FakeMountTable()
-
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        fixer, out = self.run_check(mount_table, dry_run=True)
-        self.assertEqual(
-            f"""\
+    EXPECTED_BIND_MOUNTS_AND_DIR_MISSING_DRY_RUN = Template(
+        """\
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbcode-buck-out
-Would create directory {self.fbsource_bind_mounts}/fbcode-buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbcode-buck-out
+Would create directory ${fbsource_bind_mounts}/fbcode-buck-out
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbcode/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/fbcode/buck-out
+Bind mount at ${edenfs_path1}/fbcode/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/fbcode/buck-out
 
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbandroid-buck-out
-Would create directory {self.fbsource_bind_mounts}/fbandroid-buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbandroid-buck-out
+Would create directory ${fbsource_bind_mounts}/fbandroid-buck-out
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/fbandroid/buck-out
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/fbandroid/buck-out
 
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/buck-out
-Would create directory {self.fbsource_bind_mounts}/buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/buck-out
+Would create directory ${fbsource_bind_mounts}/buck-out
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/buck-out
+Bind mount at ${edenfs_path1}/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/buck-out
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=6)
+"""
+    )
 
-    def test_bind_mount_wrong_device_dry_run(self):
-        # bm1, bm2 should not have same device as edenfs
+    def test_bind_mounts_and_dir_missing_dry_run(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
 
-        # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
+        fixer, out = self.run_check(mount_table, dry_run=True)
+        self.assertEqual(
+            self.expected_output(self.EXPECTED_BIND_MOUNTS_AND_DIR_MISSING_DRY_RUN), out
         )
+        self.assert_results(fixer, num_problems=6)
 
-        # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+    EXPECTED_BIND_MOUNT_WRONG_DEVICE_DRY_RUN = Template(
+        """\
+<yellow>- Found problem:<reset>
+Bind mount at ${edenfs_path1}/fbcode/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/fbcode/buck-out
 
-        fixer, out = self.run_check(mount_table, dry_run=True)
-        self.assertEqual(
-            f"""\
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbcode/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/fbcode/buck-out
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/fbandroid/buck-out
+
+"""
+    )
 
+    EXPECTED_BIND_MOUNT_WRONG_DEVICE = Template(
+        """\
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/fbandroid/buck-out
+Bind mount at ${edenfs_path1}/fbcode/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/fbcode/buck-out...<green>fixed<reset>
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=2)
+<yellow>- Found problem:<reset>
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/fbandroid/buck-out...<green>fixed<reset>
+
+"""
+    )
+
+    def test_bind_mount_wrong_device_dry_run(self):
+        self._test_bind_mount_wrong_device(dry_run=True)
 
     def test_bind_mount_wrong_device(self):
+        self._test_bind_mount_wrong_device(dry_run=False)
+
+    def _test_bind_mount_wrong_device(self, dry_run: bool) -> None:
         # bm1, bm2 should not have same device as edenfs
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm3] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV12
+        mount_table.stats[self.bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
 
         # These bound mind operations will succeed.
         mount_table.bind_mount_success_paths[self.client_bm1] = self.bm1
         mount_table.bind_mount_success_paths[self.client_bm2] = self.bm2
 
-        fixer, out = self.run_check(mount_table, dry_run=False)
-        self.assertEqual(
-            f"""\
-<yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbcode/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/fbcode/buck-out...<green>fixed<reset>
+        fixer, out = self.run_check(mount_table, dry_run=dry_run)
+        if dry_run:
+            self.assertEqual(
+                self.expected_output(self.EXPECTED_BIND_MOUNT_WRONG_DEVICE_DRY_RUN), out
+            )
+            self.assert_results(fixer, num_problems=2)
+        else:
+            self.assertEqual(
+                self.expected_output(self.EXPECTED_BIND_MOUNT_WRONG_DEVICE), out
+            )
+            self.assert_results(fixer, num_problems=2, num_fixed_problems=2)
 
+    EXPECTED_CLIENT_MOUNT_PATH_NOT_DIR = Template(
+        """\
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/fbandroid/buck-out...<green>fixed<reset>
+Expected ${fbsource_bind_mounts}/buck-out to be a directory
+Please remove the file at ${fbsource_bind_mounts}/buck-out
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=2, num_fixed_problems=2)
+"""
+    )
 
     def test_client_mount_path_not_dir(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
         # Note: client_bm3 is not a directory
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=33188
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm3] = STAT_FILE_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
 
         fixer, out = self.run_check(mount_table, dry_run=False)
         self.assertEqual(
-            f"""\
-<yellow>- Found problem:<reset>
-Expected {self.fbsource_bind_mounts}/buck-out to be a directory
-Please remove the file at {self.fbsource_bind_mounts}/buck-out
-
-""",
-            out,
+            self.expected_output(self.EXPECTED_CLIENT_MOUNT_PATH_NOT_DIR), out
         )
         self.assert_results(fixer, num_problems=1, num_manual_fixes=1)
 
+    EXPECTED_MOUNT_PATH_NOT_DIR = Template(
+        """\
+<yellow>- Found problem:<reset>
+Expected ${edenfs_path1}/buck-out to be a directory
+Please remove the file at ${edenfs_path1}/buck-out
+
+"""
+    )
+
     def test_mount_path_not_dir(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.client_bm3] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
         # Note: bm3 is not a directory
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=33188
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_FILE_DEV11
 
         fixer, out = self.run_check(mount_table, dry_run=False)
-        self.assertEqual(
-            f"""\
+        self.assertEqual(self.expected_output(self.EXPECTED_MOUNT_PATH_NOT_DIR), out)
+        self.assert_results(fixer, num_problems=1, num_manual_fixes=1)
+
+    EXPECTED_CLIENT_BIND_MOUNTS_MISSING_DRY_RUN = Template(
+        """\
 <yellow>- Found problem:<reset>
-Expected {self.edenfs_path1}/buck-out to be a directory
-Please remove the file at {self.edenfs_path1}/buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbcode-buck-out
+Would create directory ${fbsource_bind_mounts}/fbcode-buck-out
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=1, num_manual_fixes=1)
+<yellow>- Found problem:<reset>
+Missing client directory for bind mount ${fbsource_bind_mounts}/buck-out
+Would create directory ${fbsource_bind_mounts}/buck-out
+
+"""
+    )
 
     def test_client_bind_mounts_missing_dry_run(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
 
         fixer, out = self.run_check(mount_table, dry_run=True)
         self.assertEqual(
-            f"""\
+            self.expected_output(self.EXPECTED_CLIENT_BIND_MOUNTS_MISSING_DRY_RUN), out
+        )
+        self.assert_results(fixer, num_problems=2)
+
+    EXPECTED_CLIENT_BIND_MOUNTS_MISSING = Template(
+        """\
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbcode-buck-out
-Would create directory {self.fbsource_bind_mounts}/fbcode-buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbcode-buck-out
+Creating directory ${fbsource_bind_mounts}/fbcode-buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/buck-out
-Would create directory {self.fbsource_bind_mounts}/buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/buck-out
+Creating directory ${fbsource_bind_mounts}/buck-out...<green>fixed<reset>
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=2)
+"""
+    )
 
     def test_client_bind_mounts_missing(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
 
         fixer, out = self.run_check(mount_table, dry_run=False)
         self.assertEqual(
-            f"""\
+            self.expected_output(self.EXPECTED_CLIENT_BIND_MOUNTS_MISSING), out
+        )
+        self.assert_results(fixer, num_problems=2, num_fixed_problems=2)
+
+    EXPECTED_CLIENT_BIND_MOUNTS_MISSING_FAIL = Template(
+        """\
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbcode-buck-out
-Creating directory {self.fbsource_bind_mounts}/fbcode-buck-out...<green>fixed<reset>
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbcode-buck-out
+Creating directory ${fbsource_bind_mounts}/fbcode-buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/buck-out
-Creating directory {self.fbsource_bind_mounts}/buck-out...<green>fixed<reset>
+Missing client directory for bind mount ${fbsource_bind_mounts}/buck-out
+Creating directory ${fbsource_bind_mounts}/buck-out...<red>error<reset>
+Failed to fix problem: Failed to create directory
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=2, num_fixed_problems=2)
+"""
+    )
 
     def test_client_bind_mounts_missing_fail(self):
         mount_table = FakeMountTable()
         fs_util = FakeFsUtil()
 
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
 
         fs_util.path_error[self.client_bm3] = "Failed to create directory"
 
         fixer, out = self.run_check(mount_table, dry_run=False, fs_util=fs_util)
         self.assertEqual(
-            f"""\
-<yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbcode-buck-out
-Creating directory {self.fbsource_bind_mounts}/fbcode-buck-out...<green>fixed<reset>
-
-<yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/buck-out
-Creating directory {self.fbsource_bind_mounts}/buck-out...<red>error<reset>
-Failed to fix problem: Failed to create directory
-
-""",
-            out,
+            self.expected_output(self.EXPECTED_CLIENT_BIND_MOUNTS_MISSING_FAIL), out
         )
         self.assert_results(
             fixer, num_problems=2, num_fixed_problems=1, num_failed_fixes=1
         )
 
+    EXPECTED_BIND_MOUNTS_AND_CLIENT_DIR_MISSING_DRY_RUN = Template(
+        """\
+<yellow>- Found problem:<reset>
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbandroid-buck-out
+Would create directory ${fbsource_bind_mounts}/fbandroid-buck-out
+
+<yellow>- Found problem:<reset>
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/fbandroid/buck-out
+
+<yellow>- Found problem:<reset>
+Missing client directory for bind mount ${fbsource_bind_mounts}/buck-out
+Would create directory ${fbsource_bind_mounts}/buck-out
+
+<yellow>- Found problem:<reset>
+Bind mount at ${edenfs_path1}/buck-out is not mounted
+Would remount bind mount at ${edenfs_path1}/buck-out
+
+"""
+    )
+
     def test_bind_mounts_and_client_dir_missing_dry_run(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
 
         fixer, out = self.run_check(mount_table, dry_run=True)
         self.assertEqual(
-            f"""\
+            self.expected_output(
+                self.EXPECTED_BIND_MOUNTS_AND_CLIENT_DIR_MISSING_DRY_RUN
+            ),
+            out,
+        )
+        self.assert_results(fixer, num_problems=4)
+
+    EXPECTED_BIND_MOUNTS_AND_CLIENT_DIR_MISSING = Template(
+        """\
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbandroid-buck-out
-Would create directory {self.fbsource_bind_mounts}/fbandroid-buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbandroid-buck-out
+Creating directory ${fbsource_bind_mounts}/fbandroid-buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/fbandroid/buck-out
+Bind mount at ${edenfs_path1}/fbandroid/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/fbandroid/buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/buck-out
-Would create directory {self.fbsource_bind_mounts}/buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/buck-out
+Creating directory ${fbsource_bind_mounts}/buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/buck-out is not mounted
-Would remount bind mount at {self.edenfs_path1}/buck-out
+Bind mount at ${edenfs_path1}/buck-out is not mounted
+Remounting bind mount at ${edenfs_path1}/buck-out...<green>fixed<reset>
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=4)
+"""
+    )
 
     def test_bind_mounts_and_client_dir_missing(self):
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.client_bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.client_bm1] = STAT_DIR_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
 
         # These bound mind operations will succeed.
         mount_table.bind_mount_success_paths[self.client_bm2] = self.bm2
@@ -713,120 +601,116 @@ Would remount bind mount at {self.edenfs_path1}/buck-out
 
         fixer, out = self.run_check(mount_table, dry_run=False)
         self.assertEqual(
-            f"""\
-<yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbandroid-buck-out
-Creating directory {self.fbsource_bind_mounts}/fbandroid-buck-out...<green>fixed<reset>
+            self.expected_output(self.EXPECTED_BIND_MOUNTS_AND_CLIENT_DIR_MISSING), out
+        )
+        self.assert_results(fixer, num_problems=4, num_fixed_problems=4)
 
+    EXPECTED_CLIENT_BIND_MOUNT_MULTIPLE_ISSUES_DRY_RUN = Template(
+        """\
 <yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/fbandroid/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/fbandroid/buck-out...<green>fixed<reset>
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbcode-buck-out
+Would create directory ${fbsource_bind_mounts}/fbcode-buck-out
 
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/buck-out
-Creating directory {self.fbsource_bind_mounts}/buck-out...<green>fixed<reset>
+Expected ${fbsource_bind_mounts}/buck-out to be a directory
+Please remove the file at ${fbsource_bind_mounts}/buck-out
 
-<yellow>- Found problem:<reset>
-Bind mount at {self.edenfs_path1}/buck-out is not mounted
-Remounting bind mount at {self.edenfs_path1}/buck-out...<green>fixed<reset>
-
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=4, num_fixed_problems=4)
+"""
+    )
 
     def test_client_bind_mount_multiple_issues_dry_run(self):
+        self._test_client_bind_mount_multiple_issues_dry_run(stat_threads=1)
+
+    def test_client_bind_mount_multiple_issues_dry_run_with_stat_threads(self):
+        self._test_client_bind_mount_multiple_issues_dry_run(stat_threads=4)
+
+    def _test_client_bind_mount_multiple_issues_dry_run(self, stat_threads: int):
         # Bind mount 1 does not exist
         # Bind mount 2 has wrong device type
         # Bind mount 3 is a file instead of a directory
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=33188
-        )
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm3] = STAT_FILE_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
+
+        fixer, out = self.run_check(
+            mount_table, dry_run=True, stat_threads=stat_threads
         )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
+        self.assertEqual(
+            self.expected_output(
+                self.EXPECTED_CLIENT_BIND_MOUNT_MULTIPLE_ISSUES_DRY_RUN
+            ),
+            out,
         )
+        self.assert_results(fixer, num_problems=2, num_manual_fixes=1)
 
-        fixer, out = self.run_check(mount_table, dry_run=True)
-        self.assertEqual(
-            f"""\
+    EXPECTED_CLIENT_BIND_MOUNT_MULTIPLE_ISSUES = Template(
+        """\
 <yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbcode-buck-out
-Would create directory {self.fbsource_bind_mounts}/fbcode-buck-out
+Missing client directory for bind mount ${fbsource_bind_mounts}/fbcode-buck-out
+Creating directory ${fbsource_bind_mounts}/fbcode-buck-out...<green>fixed<reset>
 
 <yellow>- Found problem:<reset>
-Expected {self.fbsource_bind_mounts}/buck-out to be a directory
-Please remove the file at {self.fbsource_bind_mounts}/buck-out
+Expected ${fbsource_bind_mounts}/buck-out to be a directory
+Please remove the file at ${fbsource_bind_mounts}/buck-out
 
-""",
-            out,
-        )
-        self.assert_results(fixer, num_problems=2, num_manual_fixes=1)
+"""
+    )
 
     def test_client_bind_mount_multiple_issues(self):
         # Bind mount 1 does not exist
         # Bind mount 2 has wrong device type
         # Bind mount 3 is a file instead of a directory
         mount_table = FakeMountTable()
-        mount_table.stats[self.fbsource_bind_mounts] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.fbsource_bind_mounts] = STAT_DIR_DEV11
 
         # Client bind mount paths (under .eden)
-        mount_table.stats[self.edenfs_path1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=12, st_mode=16877
-        )
-        mount_table.stats[self.client_bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=33188
-        )
+        mount_table.stats[self.edenfs_path1] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm2] = STAT_DIR_DEV12
+        mount_table.stats[self.client_bm3] = STAT_FILE_DEV11
 
         # Bind mount paths (under eden path)
-        mount_table.stats[self.bm1] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm2] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
-        mount_table.stats[self.bm3] = mtab.MTStat(
-            st_uid=os.getuid(), st_dev=11, st_mode=16877
-        )
+        mount_table.stats[self.bm1] = STAT_DIR_DEV11
+        mount_table.stats[self.bm2] = STAT_DIR_DEV11
+        mount_table.stats[self.bm3] = STAT_DIR_DEV11
 
         fixer, out = self.run_check(mount_table, dry_run=False)
         self.assertEqual(
-            f"""\
-<yellow>- Found problem:<reset>
-Missing client directory for bind mount {self.fbsource_bind_mounts}/fbcode-buck-out
-Creating directory {self.fbsource_bind_mounts}/fbcode-buck-out...<green>fixed<reset>
-
-<yellow>- Found problem:<reset>
-Expected {self.fbsource_bind_mounts}/buck-out to be a directory
-Please remove the file at {self.fbsource_bind_mounts}/buck-out
-
-""",
-            out,
+            self.expected_output(self.EXPECTED_CLIENT_BIND_MOUNT_MULTIPLE_ISSUES), out
         )
         self.assert_results(
             fixer, num_problems=2, num_fixed_problems=1, num_manual_fixes=1
         )
+
+    def test_stat_threads_defaults_to_one(self):
+        self.assertEqual(1, check_bind_mounts.get_stat_threads(self.instance))
+
+    def test_stat_threads_from_config(self):
+        instance = FakeEdenInstance(
+            self.make_temporary_directory(),
+            config={"doctor.bind-mount-stat-threads": "4"},
+        )
+        self.assertEqual(4, check_bind_mounts.get_stat_threads(instance))
+
+    def test_invalid_stat_threads_config_is_logged(self):
+        for value in ("lots", "0", 4):
+            with self.subTest(value=value):
+                instance = FakeEdenInstance(
+                    self.make_temporary_directory(),
+                    config={"doctor.bind-mount-stat-threads": value},
+                )
+                with self.assertLogs() as logs_assertion:
+                    num_threads = check_bind_mounts.get_stat_threads(instance)
+                self.assertEqual(1, num_threads)
+                self.assertIn(
+                    f"ignoring invalid doctor.bind-mount-stat-threads value {value!r}",
+                    "\n".join(logs_assertion.output),
+                )
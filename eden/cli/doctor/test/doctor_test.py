@@ -1068,6 +1068,22 @@ Checking {mount}
                 os.environ["PWD"] = old_pwd
 
 
+# The doctor checks only read subscriber data, so every fake subscription result
+# can share these entries.
+_HG_SUBSCRIBERS = tuple(
+    {
+        "info": {
+            "name": name,
+            "query": {
+                "empty_on_fresh_instance": True,
+                "fields": ["name", "new", "exists", "mode"],
+            },
+        }
+    }
+    for name in check_watchman.NUCLIDE_HG_SUBSCRIPTIONS
+)
+
+
 def _create_watchman_subscription(
     filewatcher_subscriptions: Optional[List[str]] = None,
     include_hg_subscriptions: bool = True,
@@ -1091,16 +1107,5 @@ def _create_watchman_subscription(
             }
         )
     if include_hg_subscriptions:
-        for name in check_watchman.NUCLIDE_HG_SUBSCRIPTIONS:
-            subscribers.append(
-                {
-                    "info": {
-                        "name": name,
-                        "query": {
-                            "empty_on_fresh_instance": True,
-                            "fields": ["name", "new", "exists", "mode"],
-                        },
-                    }
-                }
-            )
+        subscribers.extend(_HG_SUBSCRIBERS)
     return {"subscribers": subscribers}
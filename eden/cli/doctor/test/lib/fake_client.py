@@ -9,7 +9,7 @@
 
 import binascii
 from pathlib import Path
-from typing import Callable, List, NamedTuple, Optional, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
 
 import facebook.eden.ttypes as eden_ttypes
 
@@ -20,11 +20,17 @@ class ResetParentsCommitsArgs(NamedTuple):
     parent2: Optional[bytes]
 
 
+class _FakeMount(NamedTuple):
+    client_path: bytes
+    state: Optional[eden_ttypes.MountState]
+
+
 class FakeClient:
     commit_checker: Optional[Callable[[bytes, str], bool]] = None
 
     def __init__(self):
-        self._mounts = []
+        # The thrift MountInfo objects are only built if listMounts() is called.
+        self._mounts: Dict[bytes, _FakeMount] = {}
         self.set_parents_calls: List[ResetParentsCommitsArgs] = []
 
     def __enter__(self):
@@ -33,17 +39,31 @@ class FakeClient:
     def __exit__(self, exc_type, exc_value, exc_traceback):
         pass
 
+    def add_mount(
+        self,
+        mount_point: bytes,
+        client_path: bytes,
+        state: Optional[eden_ttypes.MountState] = eden_ttypes.MountState.RUNNING,
+    ) -> None:
+        self._mounts[mount_point] = _FakeMount(client_path=client_path, state=state)
+
     def change_mount_state(self, path: Path, state: Optional[eden_ttypes.MountState]):
         """This function allows tests to change the reported state of mounts."""
         path_bytes = bytes(path)
-        for mount in self._mounts:
-            if mount.mountPoint == path_bytes:
-                mount.state = state
-                return
-        raise KeyError(f"no mount found at {path}")
+        mount = self._mounts.get(path_bytes)
+        if mount is None:
+            raise KeyError(f"no mount found at {path}")
+        self._mounts[path_bytes] = mount._replace(state=state)
 
     def listMounts(self):
-        return self._mounts
+        return [
+            eden_ttypes.MountInfo(
+                mountPoint=mount_point,
+                edenClientPath=mount.client_path,
+                state=mount.state,
+            )
+            for mount_point, mount in self._mounts.items()
+        ]
 
     def resetParentCommits(
         self, mountPoint: bytes, parents: eden_ttypes.WorkingDirectoryParents
@@ -11,19 +11,17 @@ import binascii
 import collections
 import os
 import shutil
-import stat
 import typing
 from pathlib import Path
-from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 import eden.dirstate
-import facebook.eden.ttypes as eden_ttypes
-from eden.cli import mtab
+from eden.cli import configutil, mtab
 from eden.cli.config import CheckoutConfig, EdenCheckout, EdenInstance, HealthStatus
 from fb303.ttypes import fb_status
 
 from .fake_client import FakeClient
-from .fake_mount_table import FakeMountTable
+from .fake_mount_table import DEFAULT_DIR_MODE, DEFAULT_UID, FakeMountTable
 
 
 class FakeCheckout(NamedTuple):
@@ -40,7 +38,7 @@ class FakeEdenInstance:
         tmp_dir: str,
         status: fb_status = fb_status.ALIVE,
         build_info: Optional[Dict[str, str]] = None,
-        config: Optional[Dict[str, str]] = None,
+        config: Optional[Dict[str, Any]] = None,
     ) -> None:
         self._tmp_dir = tmp_dir
         self._status = status
@@ -128,25 +126,23 @@ class FakeEdenInstance:
             dev_id = self._next_dev_id
             self._next_dev_id += 1
             self.mount_table.stats[full_path] = mtab.MTStat(
-                st_uid=os.getuid(), st_dev=dev_id, st_mode=(stat.S_IFDIR | 0o755)
+                st_uid=DEFAULT_UID, st_dev=dev_id, st_mode=DEFAULT_DIR_MODE
             )
 
             # Tell the thrift client to report the mount as active
-            self._fake_client._mounts.append(
-                eden_ttypes.MountInfo(
-                    mountPoint=os.fsencode(full_path),
-                    edenClientPath=os.fsencode(state_dir),
-                    state=eden_ttypes.MountState.RUNNING,
-                )
+            self._fake_client.add_mount(
+                os.fsencode(full_path), client_path=os.fsencode(state_dir)
             )
 
             # Set up directories on disk that look like the mounted checkout
             if setup_path:
-                os.makedirs(full_path)
+                # These also create the checkout directory itself.
                 if scm_type == "hg":
                     self._setup_hg_path(full_path, checkout, dirstate_parent)
                 elif scm_type == "git":
-                    os.mkdir(os.path.join(full_path, ".git"))
+                    os.makedirs(os.path.join(full_path, ".git"))
+                else:
+                    os.makedirs(full_path)
 
         return EdenCheckout(
             typing.cast(EdenInstance, self), Path(full_path), Path(state_dir)
@@ -165,7 +161,7 @@ class FakeEdenInstance:
         dirstate_parent: Union[str, Tuple[str, str], None],
     ):
         hg_dir = Path(full_path) / ".hg"
-        hg_dir.mkdir()
+        hg_dir.mkdir(parents=True)
         dirstate_path = hg_dir / "dirstate"
 
         if dirstate_parent is None:
@@ -235,4 +231,9 @@ class FakeEdenInstance:
         return results
 
     def get_config_value(self, key: str, default: str) -> str:
-        return self._config.get(key, default)
+        value = self._config.get(key, default)
+        if not isinstance(value, str):
+            # EdenConfigParser.get_str() rejects values of other types.
+            section, option = key.split(".", 1)
+            raise configutil.UnexpectedType(section, option, value, str)
+        return value
@@ -9,6 +9,7 @@
 
 import errno
 import os
+import stat
 import subprocess
 import typing
 from typing import Dict, List, Optional, Set, Union
@@ -16,9 +17,14 @@ from typing import Dict, List, Optional, Set, Union
 from eden.cli import mtab
 
 
+# Ownership and mode reported for fake mount points unless a test overrides them.
+DEFAULT_UID = os.getuid()
+DEFAULT_DIR_MODE = stat.S_IFDIR | 0o755
+
+
 class FakeMountTable(mtab.MountTable):
     def __init__(self) -> None:
-        self.mounts: List[mtab.MountInfo] = []
+        self._mounts: Dict[bytes, mtab.MountInfo] = {}
         self.unmount_lazy_calls: List[bytes] = []
         self.unmount_force_calls: List[bytes] = []
         self.unmount_lazy_fails: Set[bytes] = set()
@@ -37,12 +43,12 @@ class FakeMountTable(mtab.MountTable):
         vfstype: str = "fuse",
     ) -> None:
         if uid is None:
-            uid = os.getuid()
+            uid = DEFAULT_UID
         if dev is None:
             dev = self._next_dev
         self._next_dev += 1
         if mode is None:
-            mode = 16877
+            mode = DEFAULT_DIR_MODE
 
         self._add_mount_info(path, device=device, vfstype=vfstype)
         self.stats[path] = mtab.MTStat(st_uid=uid, st_dev=dev, st_mode=mode)
@@ -65,22 +71,21 @@ class FakeMountTable(mtab.MountTable):
         self.stats[path] = OSError(errnum, os.strerror(errnum))
 
     def _add_mount_info(self, path: str, device: str, vfstype: str) -> None:
-        self.mounts.append(
-            mtab.MountInfo(
-                device=device.encode("utf-8"),
-                mount_point=os.fsencode(path),
-                vfstype=vfstype.encode("utf-8"),
-            )
+        mount_point = os.fsencode(path)
+        self._mounts[mount_point] = mtab.MountInfo(
+            device=device.encode("utf-8"),
+            mount_point=mount_point,
+            vfstype=vfstype.encode("utf-8"),
         )
 
     def fail_unmount_lazy(self, *mounts: bytes) -> None:
-        self.unmount_lazy_fails |= set(mounts)
+        self.unmount_lazy_fails.update(mounts)
 
     def fail_unmount_force(self, *mounts: bytes) -> None:
-        self.unmount_force_fails |= set(mounts)
+        self.unmount_force_fails.update(mounts)
 
     def read(self) -> List[mtab.MountInfo]:
-        return self.mounts
+        return list(self._mounts.values())
 
     def unmount_lazy(self, mount_point: bytes) -> bool:
         self.unmount_lazy_calls.append(mount_point)
@@ -103,9 +108,8 @@ class FakeMountTable(mtab.MountTable):
         if isinstance(path, bytes):
             path = os.fsdecode(path)
 
-        try:
-            result = self.stats[path]
-        except KeyError:
+        result = self.stats.get(path)
+        if result is None:
             raise OSError(errno.ENOENT, f"no path {path}")
 
         if isinstance(result, BaseException):
@@ -114,11 +118,7 @@ class FakeMountTable(mtab.MountTable):
             return typing.cast(mtab.MTStat, result)
 
     def _remove_mount(self, mount_point: bytes) -> None:
-        self.mounts[:] = [
-            mount_info
-            for mount_info in self.mounts
-            if mount_info.mount_point != mount_point
-        ]
+        self._mounts.pop(mount_point, None)
 
     def create_bind_mount(self, source_path, dest_path) -> bool:
         if (
@@ -7,10 +7,11 @@
 # of patent rights can be found in the PATENTS file in the same directory.
 
 import abc
+import concurrent.futures
 import logging
 import os
 import subprocess
-from typing import List, NamedTuple, Union
+from typing import List, NamedTuple, Sequence, Union
 
 
 log = logging.getLogger("eden.cli.mtab")
@@ -23,6 +24,10 @@ MountInfo = NamedTuple(
 
 MTStat = NamedTuple("MTStat", [("st_uid", int), ("st_dev", int), ("st_mode", int)])
 
+# The result of an lstat() call in lstat_batch(): either the stat data or
+# the error raised for that path.
+LStatResult = Union[MTStat, OSError]
+
 
 class MountTable(abc.ABC):
     @abc.abstractmethod
@@ -45,6 +50,29 @@ class MountTable(abc.ABC):
     def create_bind_mount(self, source_path, dest_path) -> bool:
         "Creates a bind mount from source_path to dest_path."
 
+    def lstat_batch(
+        self, paths: Sequence[Union[bytes, str]], num_threads: int = 1
+    ) -> List[LStatResult]:
+        """Calls lstat() on each of the given paths.
+
+        Returns a list with one entry per input path, holding either the stat
+        result or the OSError raised for that path.  Up to num_threads lstat()
+        calls are issued concurrently.
+        """
+
+        def lstat(path: Union[bytes, str]) -> LStatResult:
+            try:
+                return self.lstat(path)
+            except OSError as ex:
+                return ex
+
+        if num_threads <= 1 or len(paths) <= 1:
+            return [lstat(path) for path in paths]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(num_threads, len(paths))
+        ) as executor:
+            return list(executor.map(lstat, paths))
+
 
 def parse_mtab(contents: bytes) -> List[MountInfo]:
     mounts = []
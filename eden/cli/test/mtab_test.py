@@ -7,6 +7,7 @@
 # LICENSE file in the root directory of this source tree. An additional grant
 # of patent rights can be found in the PATENTS file in the same directory.
 
+import os
 import unittest
 
 from eden.cli import mtab
@@ -29,3 +30,15 @@ edenfs /tmp/eden_test.4rec6drf/mounts/main fuse rw,nosuid,relatime,user_id=13865
         self.assertEqual("edenfs", three.device)
         self.assertEqual("/tmp/eden_test.4rec6drf/mounts/main", three.mount_point)
         self.assertEqual("fuse", three.vfstype)
+
+    def test_lstat_batch_returns_errors_in_place(self):
+        mount_table = mtab.LinuxMountTable()
+        missing = os.path.join(os.path.dirname(__file__), "does-not-exist")
+        for num_threads in (1, 4):
+            results = mount_table.lstat_batch(
+                [__file__, missing, __file__], num_threads=num_threads
+            )
+            self.assertEqual(3, len(results))
+            self.assertIsInstance(results[0], mtab.MTStat)
+            self.assertIsInstance(results[1], FileNotFoundError)
+            self.assertEqual(results[0], results[2])
@@ -8,6 +8,7 @@
 # of patent rights can be found in the PATENTS file in the same directory.
 
 import pathlib
+import re
 import subprocess
 import sys
 import typing
@@ -22,6 +23,14 @@ from .lib.find_executables import FindExe
 from .lib.systemd import SystemdUserServiceManagerMixin
 
 
+_SYSTEMD_FAIL_RE = re.compile(
+    r"Job for fb-edenfs@.+?\.service failed because "
+    r"the control process exited with error code"
+)
+_SYSTEMD_MODE_MESSAGE = "Running in experimental systemd mode"
+_STARTED_MESSAGE = "Started edenfs"
+
+
 class SystemdTest(
     unittest.TestCase,
     EnvironmentVariableMixin,
@@ -38,30 +47,23 @@ class SystemdTest(
         self.eden_dir = self.make_temporary_directory()
         self.etc_eden_dir = self.make_temporary_directory()
         self.home_dir = self.make_temporary_directory()
+        self._required_args: typing.Tuple[str, ...] = (
+            "--config-dir",
+            self.eden_dir,
+            "--etc-eden-dir",
+            self.etc_eden_dir,
+            "--home-dir",
+            self.home_dir,
+        )
 
     # TODO(T33122320): Delete this test when systemd is properly integrated.
     # TODO(T33122320): Test without --foreground.
     def test_eden_start_says_systemd_mode_is_enabled(self) -> None:
-        def test(start_args: typing.List[str]) -> None:
+        for start_args in self.get_start_args_variants():
             with self.subTest(start_args=start_args):
-                start_process: "pexpect.spawn[str]" = pexpect.spawn(
-                    FindExe.EDEN_CLI,
-                    self.get_required_eden_cli_args()
-                    + ["start", "--foreground"]
-                    + start_args,
-                    encoding="utf-8",
-                    logfile=sys.stderr,
-                )
-                start_process.expect_exact("Running in experimental systemd mode")
-                start_process.expect_exact("Started edenfs")
-
-        test(start_args=["--", "--allowRoot"])
-        test(
-            start_args=[
-                "--daemon-binary",
-                typing.cast(str, FindExe.FAKE_EDENFS),  # T38947910
-            ]
-        )
+                start_process = self.spawn_start_in_foreground(start_args)
+                start_process.expect_exact(_SYSTEMD_MODE_MESSAGE)
+                start_process.expect_exact(_STARTED_MESSAGE)
 
     # TODO(T33122320): Delete this test when systemd is properly integrated.
     def test_eden_start_with_systemd_disabled_does_not_say_systemd_mode_is_enabled(
@@ -69,39 +71,22 @@ class SystemdTest(
     ) -> None:
         self.unset_environment_variable("EDEN_EXPERIMENTAL_SYSTEMD")
 
-        def test(start_args: typing.List[str]) -> None:
+        for start_args in self.get_start_args_variants():
             with self.subTest(start_args=start_args):
-                start_process: "pexpect.spawn[str]" = pexpect.spawn(
-                    FindExe.EDEN_CLI,
-                    self.get_required_eden_cli_args()
-                    + ["start", "--foreground"]
-                    + start_args,
-                    encoding="utf-8",
-                    logfile=sys.stderr,
-                )
-                start_process.expect_exact("Started edenfs")
-                self.assertNotIn(
-                    "Running in experimental systemd mode", start_process.before
-                )
-
-        test(start_args=["--", "--allowRoot"])
-        test(
-            start_args=[
-                "--daemon-binary",
-                typing.cast(str, FindExe.FAKE_EDENFS),  # T38947910
-            ]
-        )
+                start_process = self.spawn_start_in_foreground(start_args)
+                start_process.expect_exact(_STARTED_MESSAGE)
+                self.assertNotIn(_SYSTEMD_MODE_MESSAGE, start_process.before)
 
     def test_eden_start_starts_systemd_service(self) -> None:
         self.set_up_edenfs_systemd_service()
         subprocess.check_call(
-            [typing.cast(str, FindExe.EDEN_CLI)]  # T38947910
-            + self.get_required_eden_cli_args()
-            + [
+            (
+                typing.cast(str, FindExe.EDEN_CLI),  # T38947910
+                *self.get_required_eden_cli_args(),
                 "start",
                 "--daemon-binary",
                 typing.cast(str, FindExe.FAKE_EDENFS),  # T38947910
-            ]
+            )
         )
         self.assert_systemd_service_is_active(eden_dir=pathlib.Path(self.eden_dir))
 
@@ -109,15 +94,15 @@ class SystemdTest(
         self.set_up_edenfs_systemd_service()
         self.assert_systemd_service_is_stopped(eden_dir=pathlib.Path(self.eden_dir))
         subprocess.call(
-            [typing.cast(str, FindExe.EDEN_CLI)]  # T38947910
-            + self.get_required_eden_cli_args()
-            + [
+            (
+                typing.cast(str, FindExe.EDEN_CLI),  # T38947910
+                *self.get_required_eden_cli_args(),
                 "start",
                 "--daemon-binary",
                 typing.cast(str, FindExe.FAKE_EDENFS),  # T38947910
                 "--",
                 "--failDuringStartup",
-            ]
+            )
         )
         self.assert_systemd_service_is_failed(eden_dir=pathlib.Path(self.eden_dir))
 
@@ -128,10 +113,7 @@ class SystemdTest(
         start_process = self.spawn_start_with_fake_edenfs(
             extra_args=["--", "--failDuringStartup"]
         )
-        start_process.expect(
-            r"Job for fb-edenfs@.+?\.service failed because "
-            r"the control process exited with error code"
-        )
+        start_process.expect(_SYSTEMD_FAIL_RE)
         # TODO(strager): Remove this message. journalctl is unreliable and
         # unhelpful for users.
         start_process.expect_exact("journalctl")
@@ -155,28 +137,45 @@ class SystemdTest(
             "error: The XDG_RUNTIME_DIR environment variable is not set"
         )
 
+    def get_start_args_variants(self) -> typing.List[typing.List[str]]:
+        """Return the 'eden start' arguments for each way of launching edenfs that
+        the foreground tests should cover."""
+        return [
+            ["--", "--allowRoot"],
+            ["--daemon-binary", typing.cast(str, FindExe.FAKE_EDENFS)],  # T38947910
+        ]
+
+    def spawn_start_in_foreground(
+        self, start_args: typing.Sequence[str]
+    ) -> "pexpect.spawn[str]":
+        # pexpect.spawn() needs a mutable list of arguments.
+        return pexpect.spawn(
+            FindExe.EDEN_CLI,
+            [
+                *self.get_required_eden_cli_args(),
+                "start",
+                "--foreground",
+                *start_args,
+            ],
+            encoding="utf-8",
+            logfile=sys.stderr,
+        )
+
     def spawn_start_with_fake_edenfs(
         self, extra_args: typing.Sequence[str] = ()
     ) -> "pexpect.spawn[str]":
         return pexpect.spawn(
             FindExe.EDEN_CLI,
-            self.get_required_eden_cli_args()
-            + [
+            [
+                *self.get_required_eden_cli_args(),
                 "start",
                 "--daemon-binary",
                 typing.cast(str, FindExe.FAKE_EDENFS),  # T38947910
-            ]
-            + list(extra_args),
+                *extra_args,
+            ],
             encoding="utf-8",
             logfile=sys.stderr,
         )
 
-    def get_required_eden_cli_args(self) -> typing.List[str]:
-        return [
-            "--config-dir",
-            self.eden_dir,
-            "--etc-eden-dir",
-            self.etc_eden_dir,
-            "--home-dir",
-            self.home_dir,
-        ]
+    def get_required_eden_cli_args(self) -> typing.Tuple[str, ...]:
+        return self._required_args